@@ -12,13 +12,21 @@ import sys
 import os
 import time
 import threading
+import weakref
 import ctypes
+from ctypes import wintypes
 import subprocess
+import queue
 import json
+import base64
 import zipfile
-import io
+import shutil
+import zlib
+import functools
+import math
 from pathlib import Path
 from urllib.request import urlopen, Request
+from urllib.error import HTTPError
 
 # Check for admin rights
 def is_admin():
@@ -42,9 +50,23 @@ def hide_console():
 hide_console()
 
 import winreg
-from PIL import Image, ImageDraw, ImageFont
-import pystray
-from winotify import Notification, audio
+
+# Pillow, pystray and winotify are only needed once the tray starts. They are
+# imported after the DLL check so a first-run download starts right away.
+def _import_ui():
+    from PIL import Image, ImageDraw, ImageFont
+    import pystray
+    from winotify import Notification, audio
+    
+    globals().update(
+        Image=Image,
+        ImageDraw=ImageDraw,
+        ImageFont=ImageFont,
+        pystray=pystray,
+        Notification=Notification,
+        audio=audio
+    )
+    _build_icon_assets()
 
 # =============================================================================
 # CONFIGURATION
@@ -58,6 +80,18 @@ TEMP_CRITICAL_SSD = 70    # SSD
 # Update interval in seconds
 UPDATE_INTERVAL = 3
 
+# Slower update interval once there was no user input for IDLE_THRESHOLD seconds
+# (this also covers a locked session)
+IDLE_UPDATE_INTERVAL = 30
+IDLE_THRESHOLD = 300
+
+# PowerShell reply timeouts in seconds (startup loads the DLL)
+POWERSHELL_TIMEOUT = 5
+POWERSHELL_STARTUP_TIMEOUT = 15
+
+# Maximum delay in seconds between retries after repeated read failures
+READ_RETRY_MAX_DELAY = 60
+
 # Notification cooldown in seconds
 NOTIFICATION_COOLDOWN = 60
 
@@ -71,42 +105,90 @@ PS_SCRIPT_PATH = SCRIPT_DIR / "get_cpu_temp.ps1"
 
 # Download URL
 LHM_DOWNLOAD_URL = "https://github.com/LibreHardwareMonitor/LibreHardwareMonitor/releases/download/v0.9.4/LibreHardwareMonitor-net472.zip"
+DOWNLOAD_CHUNK_SIZE = 65536
+
+# Release ZIP is kept beside the DLL, its ETag allows a conditional re-download
+LHM_ZIP_PATH = DLL_PATH.with_suffix('.zip')
+LHM_ETAG_PATH = DLL_PATH.with_suffix('.zip.etag')
 
 # =============================================================================
 # DLL DOWNLOAD
 # =============================================================================
 
+def _cached_zip_etag() -> str | None:
+    """ETag of the cached release ZIP, None if there is no usable cache"""
+    if not LHM_ZIP_PATH.exists() or not LHM_ETAG_PATH.exists():
+        return None
+    if not zipfile.is_zipfile(LHM_ZIP_PATH):
+        return None
+    return LHM_ETAG_PATH.read_text(encoding='utf-8').strip() or None
+
+def _save_response(response, dst, progress_callback=None):
+    total_size = int(response.headers.get('content-length', 0))
+    downloaded = 0
+    
+    # Progress counts bytes on the wire, before gzip decoding
+    decoder = None
+    if response.headers.get('Content-Encoding', '').lower() == 'gzip':
+        decoder = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    
+    while True:
+        chunk = response.read(DOWNLOAD_CHUNK_SIZE)
+        if not chunk:
+            break
+        downloaded += len(chunk)
+        dst.write(decoder.decompress(chunk) if decoder else chunk)
+        
+        if total_size > 0 and progress_callback:
+            progress_callback(downloaded, total_size)
+    
+    if decoder:
+        dst.write(decoder.flush())
+
 def download_lhm_dll(progress_callback=None):
     print("\n📥 Downloading LibreHardwareMonitor...")
     
     try:
-        req = Request(LHM_DOWNLOAD_URL, headers={'User-Agent': 'Mozilla/5.0'})
+        headers = {'User-Agent': 'Mozilla/5.0', 'Accept-Encoding': 'gzip'}
+        etag = _cached_zip_etag()
+        if etag:
+            headers['If-None-Match'] = etag
         
-        with urlopen(req, timeout=30) as response:
-            total_size = int(response.headers.get('content-length', 0))
-            downloaded = 0
-            chunks = []
+        req = Request(LHM_DOWNLOAD_URL, headers=headers)
+        
+        # Written next to the cache first so an aborted download can't corrupt it
+        part_path = LHM_ZIP_PATH.with_name(LHM_ZIP_PATH.name + '.part')
+        try:
+            with urlopen(req, timeout=30) as response:
+                with open(part_path, 'wb') as dst:
+                    _save_response(response, dst, progress_callback)
+                new_etag = response.headers.get('ETag')
             
-            while True:
-                chunk = response.read(8192)
-                if not chunk:
-                    break
-                chunks.append(chunk)
-                downloaded += len(chunk)
-                
-                if total_size > 0 and progress_callback:
-                    progress_callback(downloaded, total_size)
+            os.replace(part_path, LHM_ZIP_PATH)
+            if new_etag:
+                LHM_ETAG_PATH.write_text(new_etag, encoding='utf-8')
+            elif LHM_ETAG_PATH.exists():
+                LHM_ETAG_PATH.unlink()
+        except Exception as e:
+            part_path.unlink(missing_ok=True)
             
-            data = b''.join(chunks)
+            # urllib reports 304 Not Modified as an error
+            if isinstance(e, HTTPError) and e.code == 304 and etag:
+                print("   Cached ZIP is up to date")
+            elif zipfile.is_zipfile(LHM_ZIP_PATH):
+                # Offline or server error - a valid cached ZIP still does the job
+                print(f"\n⚠️  Download failed ({e}), using cached ZIP")
+            else:
+                raise
         
         print("\n📦 Extracting DLL...")
         
-        with zipfile.ZipFile(io.BytesIO(data)) as zf:
+        with zipfile.ZipFile(LHM_ZIP_PATH) as zf:
             for name in zf.namelist():
                 if name.endswith('LibreHardwareMonitorLib.dll'):
                     with zf.open(name) as src:
                         with open(DLL_PATH, 'wb') as dst:
-                            dst.write(src.read())
+                            shutil.copyfileobj(src, dst, DOWNLOAD_CHUNK_SIZE)
                     print(f"✅ DLL saved: {DLL_PATH}")
                     return True
         
@@ -117,6 +199,9 @@ def download_lhm_dll(progress_callback=None):
         print(f"❌ Download failed: {e}")
         return False
 
+# Progress bar strings for 0..100% in 5% steps
+_BARS = tuple("█" * i + "░" * (20 - i) for i in range(21))
+
 def ensure_dll_exists():
     if DLL_PATH.exists():
         return True
@@ -125,10 +210,20 @@ def ensure_dll_exists():
     print("  LibreHardwareMonitorLib.dll required")
     print("=" * 50)
     
+    last_update = 0.0
+    
     def progress(downloaded, total):
+        nonlocal last_update
         percent = (downloaded / total) * 100
-        bar = "█" * int(percent // 5) + "░" * (20 - int(percent // 5))
-        print(f"\r   [{bar}] {percent:.0f}%", end="", flush=True)
+        idx = min(int(percent // 5), 20)
+        
+        # Redraw at most every 100 ms, but always show 100%
+        now = time.monotonic()
+        if now - last_update < 0.1 and idx != 20:
+            return
+        last_update = now
+        
+        print(f"\r   [{_BARS[idx]}] {percent:.0f}%", end="", flush=True)
     
     if download_lhm_dll(progress):
         return True
@@ -147,46 +242,237 @@ def ensure_dll_exists():
 # TEMPERATURE READING
 # =============================================================================
 
+def _terminate_process(proc: subprocess.Popen):
+    if proc.poll() is None:
+        proc.kill()
+    try:
+        proc.wait(timeout=1)
+    except subprocess.TimeoutExpired:
+        pass
+
 class HardwareTemperatureReader:
-    """Reads hardware temperatures via PowerShell and LibreHardwareMonitor"""
+    """Reads hardware temperatures via LibreHardwareMonitor
+
+    The DLL is hosted in-process with pythonnet when available, so a poll is
+    just a few managed calls. Falls back to the PowerShell script otherwise.
+    PowerShell replies arrive asynchronously: poll() only sends the request
+    and on_ready is called from a helper thread once the reply is in.
+    """
     
-    def __init__(self):
+    def __init__(self, on_ready=None):
         self.last_error = None
         self.dll_available = DLL_PATH.exists()
+        self.on_ready = on_ready
+        self.computer = None
+        self._ps_command = None
+        self._ps_proc: subprocess.Popen | None = None
+        self._ps_finalizer = None
+        self._ps_lines = None
+        self._pending_deadline = None
+        self._result = {'cpu': None, 'cpu_name': 'CPU', 'gpu': None, 'gpu_name': 'GPU', 'ssds': []}
+        self._latest = {}
+        self._fail_streak = 0
+        self._next_try = 0.0
+        self._poll_started = 0.0
+        self._open_computer()
     
-    def _run_powershell(self) -> dict | None:
+    def _open_computer(self):
         if not self.dll_available:
-            self.dll_available = DLL_PATH.exists()
-            if not self.dll_available:
-                return None
+            return
+        
+        try:
+            import clr
+            clr.AddReference(str(DLL_PATH))
+            from LibreHardwareMonitor.Hardware import Computer, HardwareType, SensorType
+        except Exception as e:
+            # pythonnet missing or CLR failed to load - use PowerShell instead
+            self.last_error = f"pythonnet unavailable: {e}"
+            return
+        
+        try:
+            computer = Computer()
+            computer.IsCpuEnabled = True
+            computer.IsGpuEnabled = True
+            computer.IsStorageEnabled = True
+            computer.Open()
+        except Exception as e:
+            self.last_error = f"LibreHardwareMonitor init failed: {e}"
+            return
+        
+        self.computer = computer
+        self._computer_finalizer = weakref.finalize(self, computer.Close)
+        self._hw_cpu = HardwareType.Cpu
+        self._hw_gpus = (HardwareType.GpuNvidia, HardwareType.GpuAmd, HardwareType.GpuIntel)
+        self._hw_storage = HardwareType.Storage
+        self._sensor_temperature = SensorType.Temperature
+    
+    def _sensor_temps(self, hardware):
+        for sensor in hardware.Sensors:
+            if sensor.SensorType == self._sensor_temperature and sensor.Value is not None:
+                yield sensor.Name, round(float(sensor.Value), 1)
+    
+    def _read_computer(self) -> dict | None:
+        """Same result layout as get_cpu_temp.ps1, read from the live Computer"""
+        data = {
+            'success': True,
+            'cpu': {'name': '', 'temp': None},
+            'gpu': {'name': '', 'temp': None},
+            'ssds': []
+        }
+        
+        try:
+            for hardware in self.computer.Hardware:
+                hardware.Update()
+                hw_type = hardware.HardwareType
+                
+                # CPU
+                if hw_type == self._hw_cpu:
+                    data['cpu']['name'] = hardware.Name
+                    for name, temp in self._sensor_temps(hardware):
+                        if 'core' in name.lower():
+                            current = data['cpu']['temp']
+                            if current is None or temp > current:
+                                data['cpu']['temp'] = temp
+                
+                # GPU (NVIDIA, AMD or Intel)
+                elif hw_type in self._hw_gpus:
+                    data['gpu']['name'] = hardware.Name
+                    for name, temp in self._sensor_temps(hardware):
+                        if temp < 150:
+                            current = data['gpu']['temp']
+                            if current is None or temp > current:
+                                data['gpu']['temp'] = temp
+                
+                # Storage (SSD/HDD)
+                elif hw_type == self._hw_storage:
+                    for name, temp in self._sensor_temps(hardware):
+                        data['ssds'].append({'name': hardware.Name, 'temp': temp})
+                        break
+            
+            return data
+            
+        except Exception as e:
+            self.last_error = str(e)
+            return None
+    
+    def _load_ps_command(self) -> str | None:
+        """get_cpu_temp.ps1 wrapped as an -EncodedCommand for -Serve mode"""
+        try:
+            body = PS_SCRIPT_PATH.read_text(encoding='utf-8')
+        except OSError as e:
+            self.last_error = str(e)
+            return None
+        
+        dll_path = str(DLL_PATH).replace("'", "''")
+        command = f"& {{\n{body}\n}} -DllPath '{dll_path}' -Serve"
+        # Base64 of UTF-16LE sidesteps any command line quoting
+        return base64.b64encode(command.encode('utf-16-le')).decode('ascii')
+    
+    def _start_powershell(self) -> bool:
+        """Starts get_cpu_temp.ps1 in -Serve mode, replies are read on a helper thread"""
+        # The script is read once and passed inline, restarts don't touch the disk
+        if self._ps_command is None:
+            self._ps_command = self._load_ps_command()
+            if self._ps_command is None:
+                return False
         
         try:
-            result = subprocess.run(
+            proc = subprocess.Popen(
                 [
                     "powershell.exe",
                     "-ExecutionPolicy", "Bypass",
                     "-NoProfile",
                     "-NonInteractive",
-                    "-File", str(PS_SCRIPT_PATH),
-                    "-DllPath", str(DLL_PATH)
+                    "-EncodedCommand", self._ps_command
                 ],
-                capture_output=True,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
                 text=True,
-                timeout=10,
                 creationflags=subprocess.CREATE_NO_WINDOW
             )
-            
-            if result.stdout.strip():
-                return json.loads(result.stdout.strip())
-            
-            if result.stderr.strip():
-                self.last_error = result.stderr.strip()
-            
-            return None
-            
-        except subprocess.TimeoutExpired:
-            self.last_error = "Timeout reading temperature"
+        except Exception as e:
+            self.last_error = str(e)
+            return False
+        
+        lines = queue.Queue()
+        
+        def read_output():
+            for line in proc.stdout:
+                line = line.strip()
+                if line != 'ready':
+                    lines.put(line)
+                    self._notify_ready(lines)
+            lines.put(None)
+            self._notify_ready(lines)
+        
+        self._ps_proc = proc
+        # Kills the process even if close() is never reached
+        self._ps_finalizer = weakref.finalize(self, _terminate_process, proc)
+        self._ps_lines = lines
+        threading.Thread(target=read_output, daemon=True).start()
+        return True
+    
+    def _notify_ready(self, lines):
+        # Replies from a process that has been replaced in the meantime are dropped
+        if lines is self._ps_lines and self.on_ready is not None:
+            self.on_ready()
+    
+    def _stop_powershell(self, graceful: bool = False):
+        proc = self._ps_proc
+        finalizer = self._ps_finalizer
+        self._ps_proc = None
+        self._ps_finalizer = None
+        self._ps_lines = None
+        self._pending_deadline = None
+        if proc is None:
+            return
+        
+        if graceful:
+            try:
+                proc.stdin.write("quit\n")
+                proc.stdin.flush()
+                proc.wait(timeout=1)
+            except Exception:
+                pass
+        
+        # Kills and reaps the process unless it already exited
+        finalizer()
+    
+    def _run_powershell(self) -> bool:
+        """Sends a poll request, returns False if that already failed"""
+        if not self.dll_available:
+            self.dll_available = DLL_PATH.exists()
+            if not self.dll_available:
+                return False
+        
+        timeout = POWERSHELL_TIMEOUT
+        if self._ps_proc is None or self._ps_proc.poll() is not None:
+            self._stop_powershell()
+            if not self._start_powershell():
+                return False
+            # The first reply includes loading the DLL
+            timeout = POWERSHELL_STARTUP_TIMEOUT
+        
+        try:
+            self._ps_proc.stdin.write("poll\n")
+            self._ps_proc.stdin.flush()
+        except Exception as e:
+            self.last_error = str(e)
+            self._stop_powershell()
+            return False
+        
+        self._pending_deadline = time.monotonic() + timeout
+        return True
+    
+    def _handle_reply(self, line: str | None) -> dict | None:
+        if line is None:
+            self.last_error = "PowerShell exited unexpectedly"
+            self._stop_powershell()
             return None
+        
+        try:
+            return self._parse_output(line)
         except json.JSONDecodeError as e:
             self.last_error = f"JSON Parse Error: {e}"
             return None
@@ -194,24 +480,125 @@ class HardwareTemperatureReader:
             self.last_error = str(e)
             return None
     
+    def _parse_output(self, output: str) -> dict:
+        """Parses the key=value line printed by get_cpu_temp.ps1, JSON as fallback"""
+        try:
+            fields = dict(kv.split('=', 1) for kv in output.split(';') if kv)
+            
+            def temp(key):
+                value = fields.get(key)
+                return float(value) if value else None
+            
+            data = {
+                'success': fields.get('success') == '1',
+                'cpu': {'name': fields.get('cpu_name', ''), 'temp': temp('cpu_temp')},
+                'gpu': {'name': fields.get('gpu_name', ''), 'temp': temp('gpu_temp')},
+                'ssds': []
+            }
+            
+            index = 0
+            while f'ssd{index}_temp' in fields:
+                data['ssds'].append({
+                    'name': fields.get(f'ssd{index}_name', 'SSD'),
+                    'temp': temp(f'ssd{index}_temp')
+                })
+                index += 1
+        except ValueError:
+            return json.loads(output)
+        
+        if 'error' in fields:
+            self.last_error = fields.get('message', fields['error'])
+        
+        return data
+    
+    def poll(self) -> bool:
+        """Starts a new reading
+        
+        Returns True if the result is available from get_temperatures() right
+        away, False if a PowerShell reply is pending (on_ready will fire).
+        """
+        # Backing off after failures, the last result is still {}.
+        # Timer ticks can fire a little early, so allow some slack.
+        now = time.monotonic()
+        if now < self._next_try - 0.5:
+            return True
+        
+        # Backoff is measured from this tick, not from when a reply arrives
+        self._poll_started = now
+        
+        if self.computer is not None:
+            self._set_result(self._build_result(self._read_computer()))
+            return True
+        
+        if self._pending_deadline is not None:
+            if time.monotonic() < self._pending_deadline:
+                return False
+            self.last_error = "Timeout reading temperature"
+            self._stop_powershell()
+            self._set_result({})
+            return True
+        
+        if self._run_powershell():
+            return False
+        
+        self._set_result({})
+        return True
+    
     def get_temperatures(self) -> dict:
-        """Returns all hardware temperatures"""
-        data = self._run_powershell()
+        """Returns the latest hardware temperatures, {} if the last reading failed
         
+        The returned dict is owned by the reader and updated in place by the
+        next successful reading - callers must treat it as read-only.
+        """
+        lines = self._ps_lines
+        if lines is not None:
+            try:
+                line = lines.get_nowait()
+            except queue.Empty:
+                pass
+            else:
+                if line is None and self._pending_deadline is None:
+                    # Exit after a reply that was already counted (e.g. a
+                    # startup error line) - not a second failure
+                    self._stop_powershell()
+                else:
+                    self._pending_deadline = None
+                    self._set_result(self._build_result(self._handle_reply(line)))
+        
+        return self._latest
+    
+    def _set_result(self, result: dict):
+        self._latest = result
+        
+        if result:
+            self._fail_streak = 0
+            self._next_try = 0.0
+            return
+        
+        # Exponential backoff: UPDATE_INTERVAL, doubled per failure, capped
+        delay = min(READ_RETRY_MAX_DELAY, UPDATE_INTERVAL * 2 ** self._fail_streak)
+        self._next_try = self._poll_started + delay
+        if delay < READ_RETRY_MAX_DELAY:
+            self._fail_streak += 1
+    
+    def _build_result(self, data: dict | None) -> dict:
         if not data or not data.get('success'):
             return {}
         
-        result = {
-            'cpu': data.get('cpu', {}).get('temp'),
-            'cpu_name': data.get('cpu', {}).get('name', 'CPU'),
-            'gpu': data.get('gpu', {}).get('temp'),
-            'gpu_name': data.get('gpu', {}).get('name', 'GPU'),
-            'ssds': []
-        }
+        # Filled in place every tick instead of allocating a new dict
+        result = self._result
+        cpu = data.get('cpu', {})
+        gpu = data.get('gpu', {})
+        result['cpu'] = cpu.get('temp')
+        result['cpu_name'] = cpu.get('name', 'CPU')
+        result['gpu'] = gpu.get('temp')
+        result['gpu_name'] = gpu.get('name', 'GPU')
         
+        ssds = result['ssds']
+        ssds.clear()
         for ssd in data.get('ssds', []):
             if ssd.get('temp') is not None:
-                result['ssds'].append({
+                ssds.append({
                     'name': ssd.get('name', 'SSD'),
                     'temp': ssd.get('temp')
                 })
@@ -219,51 +606,127 @@ class HardwareTemperatureReader:
         return result
     
     def close(self):
-        pass
+        if self.computer is not None:
+            try:
+                self._computer_finalizer()
+            except Exception:
+                pass
+            self.computer = None
+        self._stop_powershell(graceful=True)
 
 # =============================================================================
 # SYSTEM TRAY ICON
 # =============================================================================
 
-def create_temp_icon(temp: float | None, warning: bool = False, critical: bool = False, no_data: bool = False) -> Image.Image:
-    size = 64
-    img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(img)
+ICON_SIZE = 64
+
+# Every character an int reading can produce, plus "?" for no data
+_GLYPH_CHARS = "0123456789-?"
+
+_STATE_COLORS = (
+    ('ok', (40, 167, 69)),
+    ('warn', (255, 193, 7)),
+    ('crit', (220, 53, 69)),
+    ('nodata', (108, 117, 125)),
+)
+
+def _render_glyph(text: str, font, height: int) -> tuple[int, int, bytes]:
+    """Rasterizes text once into (width, height, 8-bit coverage bytes)"""
+    width = max(1, math.ceil(font.getlength(text)))
+    glyph = Image.new('L', (width, height), 0)
+    ImageDraw.Draw(glyph).text((0, 0), text, fill=255, font=font)
+    return width, height, glyph.tobytes()
+
+def _make_circle_mask() -> bytes:
+    mask = Image.new('L', (ICON_SIZE, ICON_SIZE), 0)
+    ImageDraw.Draw(mask).ellipse([2, 2, ICON_SIZE-2, ICON_SIZE-2], fill=1)
+    return mask.tobytes()
+
+def _make_bg(color: tuple) -> bytes:
+    inside = bytes((*color, 255))
+    outside = bytes(4)
+    return b''.join(inside if m else outside for m in CIRCLE_MASK)
+
+def _build_icon_assets():
+    """Renders the glyph atlas and state backgrounds once, after Pillow is imported"""
+    global ICON_FONT, ICON_SMALL_FONT, GLYPHS, GLYPH_W, UNIT_GLYPH
+    global _GLYPH_TOP, _GLYPH_BOTTOM, CIRCLE_MASK, _BG
+    
+    try:
+        ICON_FONT = ImageFont.truetype("arial.ttf", 28)
+        ICON_SMALL_FONT = ImageFont.truetype("arial.ttf", 12)
+    except:
+        ICON_FONT = ImageFont.load_default()
+        ICON_SMALL_FONT = ICON_FONT
+    
+    # Glyph atlas, so building an icon needs no FreeType calls
+    _GLYPH_TOP, _GLYPH_BOTTOM = ICON_FONT.getbbox(_GLYPH_CHARS)[1::2]
+    GLYPHS = {ch: _render_glyph(ch, ICON_FONT, _GLYPH_BOTTOM) for ch in _GLYPH_CHARS}
+    GLYPH_W = {ch: glyph[0] for ch, glyph in GLYPHS.items()}
+    UNIT_GLYPH = _render_glyph("°C", ICON_SMALL_FONT, ICON_SMALL_FONT.getbbox("°C")[3])
+    
+    # 1 inside the icon's disc, 0 outside
+    CIRCLE_MASK = _make_circle_mask()
+    
+    # Raw RGBA circle backgrounds for each icon state
+    _BG = {state: _make_bg(color) for state, color in _STATE_COLORS}
+
+def _blit(buf: bytearray, glyph: tuple[int, int, bytes], x: int, y: int):
+    """Blends a white glyph into the RGBA icon buffer at (x, y)"""
+    width, height, coverage = glyph
+    for row in range(height):
+        py = y + row
+        if not 0 <= py < ICON_SIZE:
+            continue
+        for col in range(width):
+            a = coverage[row * width + col]
+            px = x + col
+            if not a or not 0 <= px < ICON_SIZE:
+                continue
+            
+            i = (py * ICON_SIZE + px) * 4
+            if buf[i + 3] == 0:
+                buf[i:i + 4] = bytes((255, 255, 255, a))
+            else:
+                # White over the background: every channel moves towards 255
+                for c in range(i, i + 4):
+                    buf[c] += (255 - buf[c]) * a // 255
+
+@functools.lru_cache(maxsize=256)
+def create_temp_icon(temp: int | None, warning: bool = False, critical: bool = False, no_data: bool = False) -> "Image.Image":
+    """Renders the tray icon. Cached per (temp, state) - callers pass the
+    temperature already truncated to int and must not modify the result."""
+    size = ICON_SIZE
     
     if no_data:
-        bg_color = (108, 117, 125)
+        state = 'nodata'
     elif critical:
-        bg_color = (220, 53, 69)
+        state = 'crit'
     elif warning:
-        bg_color = (255, 193, 7)
+        state = 'warn'
     else:
-        bg_color = (40, 167, 69)
+        state = 'ok'
     
-    draw.ellipse([2, 2, size-2, size-2], fill=bg_color)
+    buf = bytearray(_BG[state])
     
     if temp is not None:
-        temp_text = f"{int(temp)}"
+        temp_text = f"{temp}"
     else:
         temp_text = "?"
     
-    try:
-        font = ImageFont.truetype("arial.ttf", 28)
-        small_font = ImageFont.truetype("arial.ttf", 12)
-    except:
-        font = ImageFont.load_default()
-        small_font = font
-    
-    bbox = draw.textbbox((0, 0), temp_text, font=font)
-    text_width = bbox[2] - bbox[0]
-    text_height = bbox[3] - bbox[1]
+    text_width = sum(GLYPH_W[ch] for ch in temp_text)
+    text_height = _GLYPH_BOTTOM - _GLYPH_TOP
     
     x = (size - text_width) // 2
     y = (size - text_height) // 2 - 5
     
-    draw.text((x, y), temp_text, fill='white', font=font)
-    draw.text((size//2 - 6, size - 18), "°C", fill='white', font=small_font)
+    for ch in temp_text:
+        _blit(buf, GLYPHS[ch], x, y)
+        x += GLYPH_W[ch]
+    _blit(buf, UNIT_GLYPH, size//2 - 6, size - 18)
     
-    return img
+    # pystray needs a PIL image, wrap the finished buffer without copying pixels
+    return Image.frombuffer('RGBA', (size, size), bytes(buf), 'raw', 'RGBA', 0, 1)
 
 def send_notification(title: str, message: str, critical: bool = False):
     try:
@@ -290,49 +753,58 @@ def get_startup_registry_key():
         winreg.HKEY_CURRENT_USER,
         r"Software\Microsoft\Windows\CurrentVersion\Run",
         0,
-        winreg.KEY_ALL_ACCESS
+        winreg.KEY_READ | winreg.KEY_WRITE
     )
 
-def is_autostart_enabled() -> bool:
-    try:
-        key = get_startup_registry_key()
-        winreg.QueryValueEx(key, APP_NAME)
-        winreg.CloseKey(key)
-        return True
-    except WindowsError:
-        return False
+def get_autostart_command() -> str:
+    script_path = os.path.abspath(sys.argv[0])
+    
+    if script_path.endswith('.py'):
+        pythonw = sys.executable.replace('python.exe', 'pythonw.exe')
+        return f'"{pythonw}" "{script_path}"'
+    return f'"{script_path}"'
 
-def enable_autostart():
-    try:
-        key = get_startup_registry_key()
-        script_path = os.path.abspath(sys.argv[0])
-        
-        if script_path.endswith('.py'):
-            pythonw = sys.executable.replace('python.exe', 'pythonw.exe')
-            value = f'"{pythonw}" "{script_path}"'
-        else:
-            value = f'"{script_path}"'
-        
-        winreg.SetValueEx(key, APP_NAME, 0, winreg.REG_SZ, value)
-        winreg.CloseKey(key)
-        send_notification("Autostart", "✅ Autostart enabled")
-    except Exception as e:
-        send_notification("Error", f"Could not enable autostart: {e}")
+# =============================================================================
+# IDLE DETECTION
+# =============================================================================
 
-def disable_autostart():
-    try:
-        key = get_startup_registry_key()
-        winreg.DeleteValue(key, APP_NAME)
-        winreg.CloseKey(key)
-        send_notification("Autostart", "❌ Autostart disabled")
-    except WindowsError:
-        pass
+class LASTINPUTINFO(ctypes.Structure):
+    _fields_ = [
+        ('cbSize', ctypes.c_uint),
+        ('dwTime', ctypes.c_uint32),
+    ]
 
-def toggle_autostart(icon, item):
-    if is_autostart_enabled():
-        disable_autostart()
-    else:
-        enable_autostart()
+def get_idle_seconds() -> float:
+    """Seconds since the last keyboard or mouse input in this session"""
+    lii = LASTINPUTINFO()
+    lii.cbSize = ctypes.sizeof(lii)
+    if not ctypes.windll.user32.GetLastInputInfo(ctypes.byref(lii)):
+        return 0.0
+    
+    # Both tick counts are 32-bit and wrap after ~49 days
+    idle_ms = (ctypes.windll.kernel32.GetTickCount() - lii.dwTime) & 0xFFFFFFFF
+    return idle_ms / 1000
+
+# =============================================================================
+# TRAY MESSAGE LOOP
+# =============================================================================
+
+# Polling is driven by a window timer on pystray's own Win32 message loop.
+# PowerShell replies are posted back to that loop, so all icon and state
+# updates happen on a single thread.
+WM_TIMER = 0x0113
+WM_START_MONITOR = 0x8000 + 1    # WM_APP + 1
+WM_TEMPS_READY = 0x8000 + 2      # WM_APP + 2
+MONITOR_TIMER_ID = 1
+
+# Own user32 instance so these prototypes don't clash with pystray's
+_user32 = ctypes.WinDLL('user32')
+_user32.SetTimer.argtypes = (wintypes.HWND, ctypes.c_size_t, wintypes.UINT, ctypes.c_void_p)
+_user32.SetTimer.restype = ctypes.c_size_t
+_user32.KillTimer.argtypes = (wintypes.HWND, ctypes.c_size_t)
+_user32.KillTimer.restype = wintypes.BOOL
+_user32.PostMessageW.argtypes = (wintypes.HWND, wintypes.UINT, wintypes.WPARAM, wintypes.LPARAM)
+_user32.PostMessageW.restype = wintypes.BOOL
 
 # =============================================================================
 # MAIN APPLICATION
@@ -342,14 +814,66 @@ class HWTempMonitor:
     """Hardware Temperature Monitor"""
     
     def __init__(self):
-        self.running = True
-        self.temp_reader = HardwareTemperatureReader()
+        self.temp_reader = HardwareTemperatureReader(on_ready=self._post_temps_ready)
         self.temps = {}
         self.last_notification_time = 0
         self.icon = None
         self.error_shown = False
         self.critical_count = 0
+        self._last_icon_key = None
+        self._last_tip = None
+        self._poll_interval = UPDATE_INTERVAL
+        self._timer_interval = None
+        
+        # Run key stays open for the app's lifetime, its state is cached
+        self._autostart_key = None
+        self._autostart_cached: bool | None = None
+        try:
+            self._autostart_key = get_startup_registry_key()
+        except WindowsError:
+            pass
+        self.is_autostart_enabled()
         
+        self._menu = self.create_menu()
+        
+    def _startup_key(self):
+        if self._autostart_key is None:
+            self._autostart_key = get_startup_registry_key()
+        return self._autostart_key
+    
+    def is_autostart_enabled(self) -> bool:
+        if self._autostart_cached is None:
+            try:
+                winreg.QueryValueEx(self._startup_key(), APP_NAME)
+                self._autostart_cached = True
+            except WindowsError:
+                self._autostart_cached = False
+        return self._autostart_cached
+    
+    def enable_autostart(self):
+        try:
+            winreg.SetValueEx(self._startup_key(), APP_NAME, 0, winreg.REG_SZ, get_autostart_command())
+            self._autostart_cached = True
+            send_notification("Autostart", "✅ Autostart enabled")
+        except Exception as e:
+            send_notification("Error", f"Could not enable autostart: {e}")
+    
+    def disable_autostart(self):
+        try:
+            winreg.DeleteValue(self._startup_key(), APP_NAME)
+            self._autostart_cached = False
+            send_notification("Autostart", "❌ Autostart disabled")
+        except WindowsError:
+            # The value may already be gone - re-probe the real state
+            self._autostart_cached = None
+            self.is_autostart_enabled()
+    
+    def toggle_autostart(self, icon, item):
+        if self.is_autostart_enabled():
+            self.disable_autostart()
+        else:
+            self.enable_autostart()
+    
     def update_icon(self):
         if self.icon is None:
             return
@@ -363,8 +887,7 @@ class HWTempMonitor:
         warning = display_temp is not None and display_temp >= 80
         critical = display_temp is not None and display_temp >= TEMP_CRITICAL_CPU
         
-        new_icon = create_temp_icon(display_temp, warning, critical, no_data)
-        self.icon.icon = new_icon
+        icon_temp = int(display_temp) if display_temp is not None else None
         
         # Build tooltip with all temps
         lines = []
@@ -376,7 +899,17 @@ class HWTempMonitor:
             name = ssd['name'][:15] if len(ssd['name']) > 15 else ssd['name']
             lines.append(f"SSD: {ssd['temp']:.0f}°C")
         
-        self.icon.title = " | ".join(lines) if lines else "No data"
+        title = " | ".join(lines) if lines else "No data"
+        
+        # Every assignment rebuilds the HICON / tooltip in the tray - only write changes
+        icon_key = (icon_temp, warning, critical, no_data)
+        if icon_key != self._last_icon_key:
+            self.icon.icon = create_temp_icon(*icon_key)
+            self._last_icon_key = icon_key
+        
+        if title != self._last_tip:
+            self.icon.title = title
+            self._last_tip = title
     
     def check_temperatures(self):
         self.temps = self.temp_reader.get_temperatures()
@@ -389,20 +922,25 @@ class HWTempMonitor:
         elif self.temps:
             self.error_shown = False
         
-        # Check for critical temperatures
-        critical_components = []
-        
+        # Check for critical temperatures - strings are only built when needed
         cpu_temp = self.temps.get('cpu')
-        if cpu_temp is not None and cpu_temp >= TEMP_CRITICAL_CPU:
-            critical_components.append(f"CPU: {cpu_temp:.0f}°C")
-        
         gpu_temp = self.temps.get('gpu')
-        if gpu_temp is not None and gpu_temp >= TEMP_CRITICAL_GPU:
-            critical_components.append(f"GPU: {gpu_temp:.0f}°C")
+        ssds = self.temps.get('ssds', [])
+        ssd_max = max((ssd['temp'] for ssd in ssds), default=None)
         
-        for ssd in self.temps.get('ssds', []):
-            if ssd['temp'] >= TEMP_CRITICAL_SSD:
-                critical_components.append(f"SSD: {ssd['temp']:.0f}°C")
+        cpu_hot = cpu_temp is not None and cpu_temp >= TEMP_CRITICAL_CPU
+        gpu_hot = gpu_temp is not None and gpu_temp >= TEMP_CRITICAL_GPU
+        ssd_hot = ssd_max is not None and ssd_max >= TEMP_CRITICAL_SSD
+        
+        critical_components = []
+        if cpu_hot:
+            critical_components.append(f"CPU: {cpu_temp:.0f}°C")
+        if gpu_hot:
+            critical_components.append(f"GPU: {gpu_temp:.0f}°C")
+        if ssd_hot:
+            for ssd in ssds:
+                if ssd['temp'] >= TEMP_CRITICAL_SSD:
+                    critical_components.append(f"SSD: {ssd['temp']:.0f}°C")
         
         current_time = time.time()
         time_since_last = current_time - self.last_notification_time
@@ -420,19 +958,56 @@ class HWTempMonitor:
             )
             self.last_notification_time = current_time
     
-    def monitoring_loop(self):
-        while self.running:
-            try:
-                self.check_temperatures()
-                self.update_icon()
-            except Exception as e:
-                print(f"Error: {e}")
-            
-            time.sleep(UPDATE_INTERVAL)
+    def update_poll_interval(self):
+        if get_idle_seconds() > IDLE_THRESHOLD:
+            self._poll_interval = IDLE_UPDATE_INTERVAL
+        else:
+            self._poll_interval = UPDATE_INTERVAL
+    
+    def refresh(self):
+        try:
+            self.check_temperatures()
+            self.update_icon()
+            self.update_poll_interval()
+        except Exception as e:
+            print(f"Error: {e}")
+        
+        if self._timer_interval is not None and self._timer_interval != self._poll_interval:
+            self._set_timer()
+    
+    def _set_timer(self):
+        # SetTimer with an existing ID just replaces its interval
+        _user32.SetTimer(self.icon._hwnd, MONITOR_TIMER_ID, int(self._poll_interval * 1000), None)
+        self._timer_interval = self._poll_interval
+    
+    def _on_start(self, wparam, lparam):
+        self._set_timer()
+        self._on_timer(MONITOR_TIMER_ID, 0)
+    
+    def _on_timer(self, wparam, lparam):
+        if wparam == MONITOR_TIMER_ID and self.temp_reader.poll():
+            self.refresh()
+    
+    def _on_temps_ready(self, wparam, lparam):
+        self.refresh()
+    
+    def _post_temps_ready(self):
+        # Runs on the PowerShell reader thread - hand over to the tray thread
+        if self.icon is not None and self.icon._hwnd:
+            _user32.PostMessageW(self.icon._hwnd, WM_TEMPS_READY, 0, 0)
+    
+    def _setup(self, icon):
+        icon.visible = True
+        _user32.PostMessageW(icon._hwnd, WM_START_MONITOR, 0, 0)
     
     def quit_app(self, icon=None, item=None):
-        self.running = False
+        if self._timer_interval is not None:
+            _user32.KillTimer(self.icon._hwnd, MONITOR_TIMER_ID)
+            self._timer_interval = None
         self.temp_reader.close()
+        if self._autostart_key is not None:
+            winreg.CloseKey(self._autostart_key)
+            self._autostart_key = None
         if self.icon:
             self.icon.stop()
     
@@ -440,8 +1015,8 @@ class HWTempMonitor:
         return pystray.Menu(
             pystray.MenuItem(
                 "Autostart",
-                toggle_autostart,
-                checked=lambda item: is_autostart_enabled()
+                self.toggle_autostart,
+                checked=lambda item: self._autostart_cached
             ),
             pystray.Menu.SEPARATOR,
             pystray.MenuItem(
@@ -457,13 +1032,16 @@ class HWTempMonitor:
             "hw_temp_monitor",
             initial_icon,
             "HW Temp Monitor",
-            menu=self.create_menu()
+            menu=self._menu
         )
         
-        monitor_thread = threading.Thread(target=self.monitoring_loop, daemon=True)
-        monitor_thread.start()
+        # Hook into pystray's Win32 backend: its window procedure dispatches
+        # through _message_handlers, and _hwnd exists once the loop is ready
+        self.icon._message_handlers[WM_START_MONITOR] = self._on_start
+        self.icon._message_handlers[WM_TIMER] = self._on_timer
+        self.icon._message_handlers[WM_TEMPS_READY] = self._on_temps_ready
         
-        self.icon.run()
+        self.icon.run(setup=self._setup)
 
 # =============================================================================
 # ENTRY POINT
@@ -488,6 +1066,7 @@ if __name__ == "__main__":
     print("   Right-click icon for options.\n")
     
     try:
+        _import_ui()
         monitor = HWTempMonitor()
         monitor.run()
     except Exception as e:
@@ -1,44 +1,60 @@
 # Hardware Temperature Reader using LibreHardwareMonitor
 # Reads CPU, GPU and SSD temperatures
+#
+# Output is a single line of key=value pairs separated by ';', e.g.
+#   success=1;cpu_name=...;cpu_temp=62.5;gpu_name=...;gpu_temp=48;ssd0_name=...;ssd0_temp=41
+# Temperatures that could not be read are omitted.
+#
+# With -Serve the script keeps running: it prints 'ready' once the sensors
+# are open, then answers every 'poll' line on stdin with one result line
+# until it reads 'quit' or stdin is closed.
 
 param(
-    [string]$DllPath = "$PSScriptRoot\LibreHardwareMonitorLib.dll"
+    [string]$DllPath = "$PSScriptRoot\LibreHardwareMonitorLib.dll",
+    [switch]$Serve
 )
 
-if (-not (Test-Path $DllPath)) {
-    Write-Output '{"error": "DLL_NOT_FOUND"}'
-    exit 1
-}
+$Invariant = [System.Globalization.CultureInfo]::InvariantCulture
 
-try {
-    Add-Type -Path $DllPath
+function Add-Field([System.Text.StringBuilder]$sb, [string]$key, $value) {
+    if ($null -eq $value) { return }
+    if ($value -is [double] -or $value -is [single]) {
+        $text = $value.ToString($Invariant)
+    } else {
+        # ';' and '=' are separators
+        $text = ([string]$value) -replace '[;=\r\n]', ' '
+    }
+    [void]$sb.Append($key).Append('=').Append($text).Append(';')
+}
 
-    $computer = New-Object LibreHardwareMonitor.Hardware.Computer
-    $computer.IsCpuEnabled = $true
-    $computer.IsGpuEnabled = $true
-    $computer.IsStorageEnabled = $true
-    $computer.Open()
+function Get-ErrorLine([string]$errorName, [string]$message) {
+    $err = New-Object System.Text.StringBuilder
+    Add-Field $err "error" $errorName
+    Add-Field $err "message" $message
+    return $err.ToString()
+}
 
-    $result = @{
-        success = $true
-        cpu = @{ name = ""; temp = $null }
-        gpu = @{ name = ""; temp = $null }
-        ssds = @()
-    }
+function Get-SensorLine($computer) {
+    $cpuName = ""
+    $cpuTemp = $null
+    $gpuName = ""
+    $gpuTemp = $null
+    $ssdIndex = 0
+    $ssdFields = New-Object System.Text.StringBuilder
 
     foreach ($hardware in $computer.Hardware) {
         $hardware.Update()
         
         # CPU
         if ($hardware.HardwareType -eq [LibreHardwareMonitor.Hardware.HardwareType]::Cpu) {
-            $result.cpu.name = $hardware.Name
+            $cpuName = $hardware.Name
             
             foreach ($sensor in $hardware.Sensors) {
                 if ($sensor.SensorType -eq [LibreHardwareMonitor.Hardware.SensorType]::Temperature) {
                     if ($null -ne $sensor.Value -and $sensor.Name -match "Core") {
-                        $temp = [math]::Round($sensor.Value, 1)
-                        if ($null -eq $result.cpu.temp -or $temp -gt $result.cpu.temp) {
-                            $result.cpu.temp = $temp
+                        $temp = [math]::Round([double]$sensor.Value, 1)
+                        if ($null -eq $cpuTemp -or $temp -gt $cpuTemp) {
+                            $cpuTemp = $temp
                         }
                     }
                 }
@@ -49,14 +65,14 @@ try {
         if ($hardware.HardwareType -eq [LibreHardwareMonitor.Hardware.HardwareType]::GpuNvidia -or
             $hardware.HardwareType -eq [LibreHardwareMonitor.Hardware.HardwareType]::GpuAmd -or
             $hardware.HardwareType -eq [LibreHardwareMonitor.Hardware.HardwareType]::GpuIntel) {
-            $result.gpu.name = $hardware.Name
+            $gpuName = $hardware.Name
             
             foreach ($sensor in $hardware.Sensors) {
                 if ($sensor.SensorType -eq [LibreHardwareMonitor.Hardware.SensorType]::Temperature) {
                     if ($null -ne $sensor.Value -and $sensor.Value -lt 150) {
-                        $temp = [math]::Round($sensor.Value, 1)
-                        if ($null -eq $result.gpu.temp -or $temp -gt $result.gpu.temp) {
-                            $result.gpu.temp = $temp
+                        $temp = [math]::Round([double]$sensor.Value, 1)
+                        if ($null -eq $gpuTemp -or $temp -gt $gpuTemp) {
+                            $gpuTemp = $temp
                         }
                     }
                 }
@@ -65,30 +81,75 @@ try {
         
         # Storage (SSD/HDD)
         if ($hardware.HardwareType -eq [LibreHardwareMonitor.Hardware.HardwareType]::Storage) {
-            $ssd = @{
-                name = $hardware.Name
-                temp = $null
-            }
-            
             foreach ($sensor in $hardware.Sensors) {
                 if ($sensor.SensorType -eq [LibreHardwareMonitor.Hardware.SensorType]::Temperature) {
                     if ($null -ne $sensor.Value) {
-                        $ssd.temp = [math]::Round($sensor.Value, 1)
+                        Add-Field $ssdFields "ssd$($ssdIndex)_name" $hardware.Name
+                        Add-Field $ssdFields "ssd$($ssdIndex)_temp" ([math]::Round([double]$sensor.Value, 1))
+                        $ssdIndex++
                         break
                     }
                 }
             }
-            
-            if ($null -ne $ssd.temp) {
-                $result.ssds += $ssd
-            }
+        }
+    }
+
+    $out = New-Object System.Text.StringBuilder
+    Add-Field $out "success" 1
+    Add-Field $out "cpu_name" $cpuName
+    Add-Field $out "cpu_temp" $cpuTemp
+    Add-Field $out "gpu_name" $gpuName
+    Add-Field $out "gpu_temp" $gpuTemp
+    [void]$out.Append($ssdFields.ToString())
+    return $out.ToString()
+}
+
+function Write-Line([string]$line) {
+    [Console]::Out.WriteLine($line)
+    [Console]::Out.Flush()
+}
+
+if (-not (Test-Path $DllPath)) {
+    Write-Output 'error=DLL_NOT_FOUND'
+    exit 1
+}
+
+try {
+    Add-Type -Path $DllPath
+
+    $computer = New-Object LibreHardwareMonitor.Hardware.Computer
+    $computer.IsCpuEnabled = $true
+    $computer.IsGpuEnabled = $true
+    $computer.IsStorageEnabled = $true
+    $computer.Open()
+} catch {
+    Write-Output (Get-ErrorLine "EXCEPTION" $_.Exception.Message)
+    exit 1
+}
+
+if ($Serve) {
+    Write-Line 'ready'
+
+    while ($null -ne ($command = [Console]::In.ReadLine())) {
+        if ($command -eq 'quit') { break }
+        if ($command -ne 'poll') { continue }
+
+        try {
+            Write-Line (Get-SensorLine $computer)
+        } catch {
+            Write-Line (Get-ErrorLine "EXCEPTION" $_.Exception.Message)
         }
     }
 
     $computer.Close()
-    $result | ConvertTo-Json -Compress -Depth 5
+    exit 0
+}
 
+try {
+    $line = Get-SensorLine $computer
+    $computer.Close()
+    Write-Output $line
 } catch {
-    @{ error = "EXCEPTION"; message = $_.Exception.Message } | ConvertTo-Json -Compress
+    Write-Output (Get-ErrorLine "EXCEPTION" $_.Exception.Message)
     exit 1
 }